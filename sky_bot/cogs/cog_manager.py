@@ -48,6 +48,7 @@ async def disable(self, ctx: commands.Context, cog_name):
         # 禁止禁用自己的功能
         if cog_name == CogManager.__name__ or self.bot.get_cog(cog_name) is None:
             await ctx.send(f"`No function named {cog_name}.`")
+            return
         await self.bot.remove_cog(cog_name)
 
     @commands.command()
@@ -9,13 +9,15 @@
 from ..sky_bot import SkyBot
 from ..sky_event import DailyEvent, daily_event_datas, get_daily_event_time
 from ..sky_event.shard import get_shard_info
-from ..utils import code_block, msg_exist_async, sky_time_now
+from ..utils import code_block, sky_time_now
 
 __all__ = ("DailyClock",)
 
 
 class DailyClock(commands.Cog):
     _CLOCK_MSG_ID = "-# ᴰᵃᶦˡʸᴱᵛᵉⁿᵗˢ"
+    _HEADER = "# Sky Daily Clock\n"
+    _FOOTER = "\n\n*See [Sky Clock](<https://sky-clock.netlify.app>) by [Chris Stead](<https://github.com/cmstead>) for more.*"
 
     def __init__(self, bot: SkyBot):
         self.bot = bot
@@ -28,30 +30,30 @@ async def cog_unload(self):
     def get_daily_event_msg(self, when: datetime, daily_id: DailyEvent):
         name = daily_event_datas[daily_id].name
         current_end, next_begin = get_daily_event_time(when, daily_id)
-        # 事件名称
-        msg = f"## {name}\n"
         # 当前事件结束时间
+        current = ""
         if current_end is not None:
-            msg += f"🔹 Current ends {timestamp(current_end, 'R')}.\n"
-        # 下次事件开始时间
-        msg += f"🔸 Next at {timestamp(next_begin, 't')}, {timestamp(next_begin, 'R')}."
+            current = f"🔹 Current ends {timestamp(current_end, 'R')}.\n"
+        # 事件名称，以及下次事件开始时间
+        msg = (
+            f"## {name}\n{current}"
+            f"🔸 Next at {timestamp(next_begin, 't')}, {timestamp(next_begin, 'R')}."
+        )
         return msg
 
     def get_all_daily_event_msg(self, when: datetime, header=True, footer=True):
-        dailies = list(DailyEvent)
         shard_info = get_shard_info(when)
         # 如果今天Peaks Shard不提供烛火，则无需显示其信息
-        if not (shard_info.has_shard and shard_info.extra_shard):
-            dailies.remove(DailyEvent.PEAKS_SHARD)  # 移除该事件
-        msgs = [self.get_daily_event_msg(when, e) for e in dailies]
-        dailies_msg = "\n".join(msgs)
+        show_peaks = shard_info.has_shard and shard_info.extra_shard
+        dailies_msg = "\n".join(
+            self.get_daily_event_msg(when, e)
+            for e in DailyEvent
+            if show_peaks or e != DailyEvent.PEAKS_SHARD
+        )
         if header:
-            dailies_msg = "# Sky Daily Clock\n" + dailies_msg
+            dailies_msg = self._HEADER + dailies_msg
         if footer:
-            dailies_msg = (
-                dailies_msg
-                + "\n\n*See [Sky Clock](<https://sky-clock.netlify.app>) by [Chris Stead](<https://github.com/cmstead>) for more.*"
-            )
+            dailies_msg += self._FOOTER
         return dailies_msg
 
     @commands.command()
@@ -68,24 +70,12 @@ async def update_clock_msg(self):
         now = sky_time_now()
         daily_event_msg = self.get_all_daily_event_msg(now)
         daily_event_msg = self._CLOCK_MSG_ID + "\n" + daily_event_msg
-        # 如果已记录消息，则直接更新
-        message = self.clock_message
-        if message and await msg_exist_async(message):
-            await message.edit(content=daily_event_msg)
-            print(f"[{sky_time_now()}] Success editting clock message.")
-            return
-        # 查找频道和消息
-        channel = self.bot.get_bot_channel()
-        message = await self.bot.search_message_async(channel, self._CLOCK_MSG_ID)
-        # 如果消息不存在，则发送新消息；否则编辑现有消息
-        if message is None:
-            message = await channel.send(daily_event_msg)
-            print(f"[{sky_time_now()}] Success sending clock message.")
-        else:
-            await message.edit(content=daily_event_msg)
-            print(f"[{sky_time_now()}] Success editing clock message.")
-        # 记录消息，下次可以直接使用
-        self.clock_message = message
+        # 更新或发送消息，并记录消息，下次可以直接使用
+        self.clock_message, action = await self.bot.upsert_message_async(
+            self.clock_message, self._CLOCK_MSG_ID, daily_event_msg
+        )
+        if action is not None:
+            print(f"[{sky_time_now()}] Clock message {action} successfully.")
 
     @update_clock_msg.before_loop
     async def wait_on_minute(self):
@@ -3,7 +3,7 @@
 import discord
 from discord.ext import commands
 
-from ..utils import get_id_from_env
+from ..utils import get_id_from_env, sky_time_now
 
 __all__ = ("Greeting",)
 
@@ -21,7 +21,14 @@ async def on_member_join(self, member: discord.Member):
             self.default_role_id is not None
             and (default_role := guild.get_role(self.default_role_id)) is not None
         ):
-            await member.add_roles(default_role)
+            # 没有管理角色权限或角色高于机器人时无法分配，提示检查设置
+            if default_role.is_assignable() and guild.me.guild_permissions.manage_roles:
+                await member.add_roles(default_role)
+            else:
+                print(
+                    f"[{sky_time_now()}] Cannot assign default role "
+                    f"{default_role.name} ({default_role.id}) to {member}."
+                )
         # 发送欢迎消息
         if guild.system_channel is not None:
             await asyncio.sleep(1)
@@ -31,10 +38,10 @@ async def on_member_join(self, member: discord.Member):
     @commands.command()
     async def hello(self, ctx: commands.Context):
         author = ctx.author
-        is_member = isinstance(author, discord.Member)
+        top_role = author.top_role if isinstance(author, discord.Member) else None
         # 如果成员有分配角色
-        if is_member and author.top_role.name != "@everyone":
-            hello = f"Hello **{author.top_role.name}** {author.mention}!"
+        if top_role is not None and not top_role.is_default():
+            hello = f"Hello **{top_role.name}** {author.mention}!"
         # 如果非成员，或成员没有分配角色
         else:
             hello = f"Hello {author.mention}!"
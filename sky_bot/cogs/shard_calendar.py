@@ -2,6 +2,7 @@
 import os
 import typing
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 import discord
 from discord.ext import commands, tasks
@@ -9,7 +10,7 @@
 
 from ..sky_bot import SkyBot
 from ..sky_event.shard import ShardInfo, ShardType, get_shard_info
-from ..utils import code_block, msg_exist_async, sky_time, sky_time_now
+from ..utils import code_block, sky_time, sky_time_now
 from .daily_clock import DailyClock
 
 __all__ = ("ShardCalendar",)
@@ -18,14 +19,19 @@
 class ShardCalendar(commands.Cog):
     _CONFIG_PATH_ = "extern_config/shard.json"
     _CALENDAR_MSG_ID = "-# ˢʰᵃʳᵈᴱᵛᵉⁿᵗ"
+    _HEADER = "# 🌋 Shard Calendar\n"
+    _FOOTER = "\n\n-# *See [Sky Shards](<https://sky-shards.pages.dev/>) by [Plutoy](<https://github.com/PlutoyDev>) for more.*"
 
     def __init__(self, bot: SkyBot):
         self.bot = bot
-        # 加载外部配置
-        self.config = {}
+        # 加载外部配置，没有配置时使用默认翻译，加载后只读
+        config = {}
         if os.path.exists(self._CONFIG_PATH_):
             with open(self._CONFIG_PATH_, encoding="utf-8") as f:
-                self.config = json.load(f)
+                config = json.load(f)
+        if not config:
+            config = {"translations": _default_translation}
+        self.config = MappingProxyType(config)
         self.calendar_message: discord.Message = None
         # 设置更新时间
         self.set_update_time()
@@ -34,13 +40,11 @@ def __init__(self, bot: SkyBot):
 
     async def cog_unload(self):
         self.update_calendar_msg.cancel()
+        self.refresh_calendar_state.cancel()
 
     def _config(self, key):
         # 获取配置项
-        val = self.config.get(key, {})
-        if self.config == {} and key == "translations":
-            val = _default_translation
-        return val
+        return self.config.get(key, {})
 
     def _date_msg(self, info: ShardInfo):
         # 日期信息
@@ -68,7 +72,7 @@ def _map_msg(self, info: ShardInfo):
         graph = self._config("infographics")
         msg += trans[info.realm] + " || "
         # 给地图名称添加图片链接
-        if link := graph.get(".".join([info.realm, info.map])):
+        if link := graph.get(f"{info.realm}.{info.map}"):
             msg += f"[{trans[info.map]}]({link})"
         else:
             msg += trans[info.map]
@@ -89,8 +93,7 @@ def _occur(land, end):
         now = now or sky_time_now()
         msg = "- **__Timeline__:**\n"
         # 取降落时间和结束时间为起止时间（忽略开始时间）
-        occur_msgs = [_occur(land, end) for start, land, end in info.occurrences]
-        msg += "\n".join(occur_msgs)
+        msg += "\n".join(_occur(land, end) for start, land, end in info.occurrences)
         return msg
 
     def _coming_msg(self, info: ShardInfo, days):
@@ -110,8 +113,7 @@ def _symbol(when: datetime):
             return symbol
 
         msg = "- **__The coming days__:**\n"
-        days_symbol = [_symbol(info.date + timedelta(days=i + 1)) for i in range(days)]
-        msg += " ".join(days_symbol)
+        msg += " ".join(_symbol(info.date + timedelta(days=i + 1)) for i in range(days))
         return msg
 
     def _extra_msg(self, info: ShardInfo):
@@ -119,42 +121,35 @@ def _extra_msg(self, info: ShardInfo):
         if not info.extra_shard:
             # 不存在额外碎片就返回空字符串
             return ""
-        msg = "- ☄️ **Extra shard day! See Daily Clock.**"
+        clock = "Daily Clock"
         # 链接到日常事件时刻消息以提供细节
         daily_cog: DailyClock = self.bot.get_cog(DailyClock.__name__)
-        if clock_msg := daily_cog.clock_message:
-            msg = msg.replace("Daily Clock", f"[Daily Clock](<{clock_msg.jump_url}>)")
+        if daily_cog and (clock_msg := daily_cog.clock_message):
+            clock = f"[{clock}](<{clock_msg.jump_url}>)"
+        msg = f"- ☄️ **Extra shard day! See {clock}.**"
         return msg
 
     def get_shard_event_msg(self, when: datetime, now=None, header=True, footer=True):
         info = get_shard_info(when)
         if info.has_shard:
             # 添加完整碎石事件信息
-            msg = "\n".join(
-                [
-                    m
-                    for m in [
-                        self._date_msg(info),
-                        self._type_msg(info),
-                        self._map_msg(info),
-                        self._timeline_msg(info, now),
-                        self._extra_msg(info),
-                        self._coming_msg(info, self._config("coming_days")),
-                    ]
-                    if m != ""
-                ]
+            msgs = (
+                self._date_msg(info),
+                self._type_msg(info),
+                self._map_msg(info),
+                self._timeline_msg(info, now),
+                self._extra_msg(info),
+                self._coming_msg(info, self._config("coming_days")),
             )
+            msg = "\n".join(m for m in msgs if m != "")
         else:
             # 没有碎石事件，只添加后续几天信息
             msg = "## ☀️ **It's a no shard day!**\n"
             msg += self._coming_msg(info, self._config("coming_days"))
         if header:
-            msg = "# 🌋 Shard Calendar\n" + msg
+            msg = self._HEADER + msg
         if footer:
-            msg = (
-                msg
-                + "\n\n-# *See [Sky Shards](<https://sky-shards.pages.dev/>) by [Plutoy](<https://github.com/PlutoyDev>) for more.*"
-            )
+            msg += self._FOOTER
         return msg
 
     def set_update_time(self):
@@ -168,33 +163,21 @@ def set_update_time(self):
     async def shard(self, ctx: commands.Context, offset: typing.Optional[int] = 0):
         now = sky_time_now()
         when = now + timedelta(days=offset)
-        msg = self.get_shard_event_msg(when)
+        msg = self.get_shard_event_msg(when, now)
         await ctx.send(msg)
 
     @tasks.loop()
     async def update_calendar_msg(self):
         # 生成事件信息
         now = sky_time_now()
-        shard_event_msg = self.get_shard_event_msg(now)
+        shard_event_msg = self.get_shard_event_msg(now, now)
         shard_event_msg = self._CALENDAR_MSG_ID + "\n" + shard_event_msg
-        # 如果已记录消息，则直接更新
-        message = self.calendar_message
-        if message and await msg_exist_async(message):
-            await message.edit(content=shard_event_msg)
-            print(f"[{sky_time_now()}] Success editting calendar message.")
-            return
-        # 查找频道和消息
-        channel = self.bot.get_bot_channel()
-        message = await self.bot.search_message_async(channel, self._CALENDAR_MSG_ID)
-        # 如果消息不存在，则发送新消息；否则编辑现有消息
-        if message is None:
-            message = await channel.send(shard_event_msg)
-            print(f"[{sky_time_now()}] Success sending calendar message.")
-        else:
-            await message.edit(content=shard_event_msg)
-            print(f"[{sky_time_now()}] Success editing calendar message.")
-        # 记录消息，下次可以直接使用
-        self.calendar_message = message
+        # 更新或发送消息，并记录消息，下次可以直接使用
+        self.calendar_message, action = await self.bot.upsert_message_async(
+            self.calendar_message, self._CALENDAR_MSG_ID, shard_event_msg
+        )
+        if action is not None:
+            print(f"[{sky_time_now()}] Calendar message {action} successfully.")
 
     @update_calendar_msg.before_loop
     async def setup_update_calendar_msg(self):
@@ -224,33 +207,35 @@ async def refresh_calendar_state(self):
         print(f"[{sky_time_now()}] Calendar state updated.")
 
 
-_default_translation = {
-    "prairie": "Daylight Prairie",
-    "forest": "Hidden Forest",
-    "valley": "Valley of Triumph",
-    "wasteland": "Golden Wasteland",
-    "vault": "Vault of Knowledge",
-    "village": "Village Islands",
-    "butterfly": "Butterfly Fields",
-    "cave": "Prairie Cave",
-    "bird": "Bird Nest",
-    "sanctuary": "Sanctuary Islands",
-    "boneyard": "Boneyard",
-    "brook": "Forest Brook",
-    "end": "Forest End",
-    "treehouse": "Assembly Treehouse",
-    "granny": "Elevated Clearing",
-    "rink": "Ice Rink",
-    "dreams": "Village of Dreams",
-    "hermit": "Hermit Valley",
-    "battlefield": "Battlefield",
-    "temple": "Broken Temple",
-    "graveyard": "Graveyard",
-    "crab": "Crab Fields",
-    "ark": "Forgotten Ark",
-    "starlight": "Starlight Desert",
-    "jellyfish": "Jellyfish Cove",
-}
+_default_translation = MappingProxyType(
+    {
+        "prairie": "Daylight Prairie",
+        "forest": "Hidden Forest",
+        "valley": "Valley of Triumph",
+        "wasteland": "Golden Wasteland",
+        "vault": "Vault of Knowledge",
+        "village": "Village Islands",
+        "butterfly": "Butterfly Fields",
+        "cave": "Prairie Cave",
+        "bird": "Bird Nest",
+        "sanctuary": "Sanctuary Islands",
+        "boneyard": "Boneyard",
+        "brook": "Forest Brook",
+        "end": "Forest End",
+        "treehouse": "Assembly Treehouse",
+        "granny": "Elevated Clearing",
+        "rink": "Ice Rink",
+        "dreams": "Village of Dreams",
+        "hermit": "Hermit Valley",
+        "battlefield": "Battlefield",
+        "temple": "Broken Temple",
+        "graveyard": "Graveyard",
+        "crab": "Crab Fields",
+        "ark": "Forgotten Ark",
+        "starlight": "Starlight Desert",
+        "jellyfish": "Jellyfish Cove",
+    }
+)
 
 
 async def setup(bot: commands.Bot):
@@ -1,3 +1,6 @@
+import asyncio
+import traceback
+
 import discord
 from discord.ext import commands
 
@@ -18,9 +21,19 @@ def __init__(self, *args, initial_extensions: list[str], **kwargs):
 
     async def setup_hook(self) -> None:
         # 加载初始扩展
-        for extension in self.initial_extensions:
-            extension = "sky_bot.cogs." + extension
-            await self.load_extension(extension)
+        await self.load_initial_extensions()
+
+    async def load_initial_extensions(self):
+        # 加载所有初始扩展，单个扩展失败不影响其他扩展
+        extensions = ["sky_bot.cogs." + ext for ext in self.initial_extensions]
+        results = await asyncio.gather(
+            *(self.load_extension(ext) for ext in extensions),
+            return_exceptions=True,
+        )
+        for extension, result in zip(extensions, results):
+            if isinstance(result, BaseException):
+                print(f"Failed to load extension {extension}:")
+                traceback.print_exception(result)
 
     async def on_ready(self):
         print(f"We have logged in as {self.user}")
@@ -57,3 +70,26 @@ async def search_message_async(self, channel: discord.TextChannel, id: str):
             lambda m: self.is_mine(m) and m.content.startswith(id),
             channel.history(),
         )
+
+    async def upsert_message_async(
+        self, message: discord.Message | None, id: str, content: str
+    ) -> tuple[discord.Message, str | None]:
+        # 返回消息以及执行的操作："sent"、"edited"，未修改时为None
+        # 如果已记录消息，则直接更新（消息已被删除时再重新查找）
+        if message is not None:
+            # 内容没有变化时无需编辑；有意不确认消息是否存在，被删除的消息会在下次内容变化时重新发送
+            if message.content == content:
+                return message, None
+            try:
+                return await message.edit(content=content), "edited"
+            except discord.NotFound:
+                pass
+        # 查找频道和消息
+        channel = self.get_bot_channel()
+        message = await self.search_message_async(channel, id)
+        # 如果消息不存在，则发送新消息；否则仅在内容变化时编辑现有消息
+        if message is None:
+            return await channel.send(content), "sent"
+        if message.content != content:
+            return await message.edit(content=content), "edited"
+        return message, None
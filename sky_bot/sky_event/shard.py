@@ -1,5 +1,6 @@
 from datetime import datetime, time, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import NamedTuple
 
 from ..utils import SKY_TIMEZONE
@@ -19,6 +20,18 @@
 SHARD_TIMES = 3
 
 
+def _occur_offsets(interval: timedelta):
+    # 预先计算每次碎片相对首次开始时间的开始、降落和结束偏移
+    return tuple(
+        (i * interval, i * interval + LAND_OFFSET, i * interval + SHARD_DURATION)
+        for i in range(SHARD_TIMES)
+    )
+
+
+_BLACK_OFFSETS = _occur_offsets(BLACK_INTERVAL)
+_RED_OFFSETS = _occur_offsets(RED_INTERVAL)
+
+
 class ShardType(Enum):
     Black = 0
     Red = 1
@@ -40,7 +53,7 @@ class ShardInfo(NamedTuple):
     type: ShardType
     realm: str
     map: str
-    occurrences: list[ShardTime]
+    occurrences: tuple[ShardTime, ...]
     reward_type: RewardType
     reward_number: float
     has_shard: bool
@@ -52,7 +65,7 @@ class _ShardData(NamedTuple):
     maps: list[str]
     reward_type: RewardType
     reward_number: float
-    no_shard_day: list[int]
+    no_shard_day: frozenset[int]
 
 
 realms = ["prairie", "forest", "valley", "wasteland", "vault"]
@@ -63,14 +76,14 @@ class _ShardData(NamedTuple):
         maps=["village", "boneyard", "rink", "battlefield", "starlight"],
         reward_type=RewardType.Wax,
         reward_number=200,
-        no_shard_day=[0, 6],
+        no_shard_day=frozenset({0, 6}),
     ),
     _ShardData(
         start=time(1, 50),
         maps=["butterfly", "brook", "rink", "temple", "starlight"],
         reward_type=RewardType.Wax,
         reward_number=200,
-        no_shard_day=[5, 6],
+        no_shard_day=frozenset({5, 6}),
     ),
 ]
 red_datas = [
@@ -79,21 +92,21 @@ class _ShardData(NamedTuple):
         maps=["cave", "end", "dreams", "graveyard", "jellyfish"],
         reward_type=RewardType.AC,
         reward_number=2,
-        no_shard_day=[0, 1],
+        no_shard_day=frozenset({0, 1}),
     ),
     _ShardData(
         start=time(2, 20),
         maps=["bird", "treehouse", "dreams", "crab", "jellyfish"],
         reward_type=RewardType.AC,
         reward_number=2.5,
-        no_shard_day=[1, 2],
+        no_shard_day=frozenset({1, 2}),
     ),
     _ShardData(
         start=time(3, 30),
         maps=["sanctuary", "granny", "hermit", "ark", "jellyfish"],
         reward_type=RewardType.AC,
         reward_number=3.5,
-        no_shard_day=[2, 3],
+        no_shard_day=frozenset({2, 3}),
     ),
 ]
 
@@ -116,6 +129,12 @@ def _get_data(day) -> tuple[_ShardData, bool]:
 def get_shard_info(when: datetime):
     when = when.astimezone(SKY_TIMEZONE)
     date = when.replace(hour=0, minute=0, second=0, microsecond=0)
+    return _get_shard_info_of_date(date)
+
+
+# 碎片信息只与日期有关，缓存最近查询过的日期
+@lru_cache(maxsize=64)
+def _get_shard_info_of_date(date: datetime) -> ShardInfo:
     day = date.day
     realm_idx = (day - 1) % len(realms)
     data, is_red = _get_data(day)
@@ -126,13 +145,11 @@ def get_shard_info(when: datetime):
     extra_shard = realm == "prairie" and map == "butterfly"
 
     first_start = datetime.combine(date, data.start, SKY_TIMEZONE)
-    interval = RED_INTERVAL if is_red else BLACK_INTERVAL
-    occur = []
-    for i in range(SHARD_TIMES):
-        start = first_start + i * interval
-        land = start + LAND_OFFSET
-        end = start + SHARD_DURATION
-        occur.append(ShardTime(start, land, end))
+    offsets = _RED_OFFSETS if is_red else _BLACK_OFFSETS
+    occur = tuple(
+        ShardTime(first_start + start, first_start + land, first_start + end)
+        for start, land, end in offsets
+    )
 
     return ShardInfo(
         date=date,
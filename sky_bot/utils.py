@@ -1,19 +1,20 @@
 import os
 from datetime import datetime, time
+from functools import cache
 
-import discord
 from zoneinfo import ZoneInfo
 
 __all__ = (
     "SKY_TIMEZONE",
     "get_id_from_env",
     "sky_time_now",
-    "msg_exist_async",
 )
 
 SKY_TIMEZONE = ZoneInfo("America/Los_Angeles")
 
 
+# 环境变量在启动时加载后不再变化，每个键只解析一次
+@cache
 def get_id_from_env(key):
     if (id_str := os.getenv(key)) is None:
         raise Exception("Missing environment variable " + key)
@@ -38,11 +39,3 @@ def sky_time(hour=0, minute=0, second=0, microsecond=0) -> time:
 
 def code_block(msg, lang=None):
     return f"```{lang}\n{msg}\n```"
-
-
-async def msg_exist_async(msg: discord.Message):
-    try:
-        await msg.fetch()
-        return True
-    except discord.NotFound:
-        return False